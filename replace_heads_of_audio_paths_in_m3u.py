@@ -1,100 +1,189 @@
+import io
+import os
+import re
 import sys
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Self, Tuple
+from typing import Dict, FrozenSet, List, Optional, Self, TextIO, Tuple
 
 import yaml
 from pydantic import BaseModel, ConfigDict, field_validator
 
 
+@lru_cache(maxsize=4096)
+def _list_dir_entry_names(dir_path: str) -> Optional[FrozenSet[str]]:
+    """
+    フォルダ直下のエントリ名を1回の走査でまとめて取得し、その結果をキャッシュする。
+    ※同じフォルダ配下の楽曲ファイルごとにファイルシステムへ問い合わせずに済ませるため。
+    シンボリックリンクは、リンク先の実在を別途確認する必要があるため含めない。
+
+    Args:
+        dir_path (str): 走査対象のフォルダのパスの文字列。
+
+    Returns:
+        Optional[FrozenSet[str]]: フォルダ直下のエントリ名の集合。フォルダを走査できない場合はNone。
+    """
+    try:
+        with os.scandir(dir_path) as entries:
+            return frozenset(entry.name for entry in entries if not entry.is_symlink())
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=65536)
+def _path_exists(path: str) -> bool:
+    """
+    パスが実在するかどうかを確認し、その結果をキャッシュする。
+    ※処理中に楽曲ファイルやそのフォルダの有無は変わらない前提で、同じパスへの問い合わせを省くため。
+    親フォルダの確認結果や親フォルダ直下のエントリ名もキャッシュされるため、
+    同じフォルダ配下の楽曲ファイル間で共有される。
+
+    Args:
+        path (str): 確認対象のパスの文字列。
+
+    Returns:
+        bool: パスが実在する場合はTrue。
+    """
+    parent_path = os.path.dirname(path)
+    if parent_path in ('', path):
+        return os.path.exists(path)
+
+    # 親フォルダが実在しない場合は、配下のパスも実在しないためファイルシステムへの問い合わせを省く
+    if not _path_exists(parent_path):
+        return False
+
+    entry_names = _list_dir_entry_names(parent_path)
+    if entry_names is not None and os.path.basename(path) in entry_names:
+        return True
+
+    # 大文字・小文字を区別しないファイルシステムやシンボリックリンクなど、
+    # エントリ名の一覧だけでは判定できない場合があるため、一覧に無いパスは直接確認する
+    return os.path.exists(path)
+
+
 class AudioPath:
     """
     音楽ファイルのパスを表すクラス。
+    楽曲ごとに大量に生成されるため、パスはPathオブジェクトではなく正規化した文字列として保持する。
     """
 
-    __path: Path
+    __path: str
 
-    def __init__(self, path: Path):
+    def __init__(self, path: Path | str):
+        """
+        Args:
+            path (Path | str): 音楽ファイルのファイルパス。
         """
+        self.__path = AudioPath.__normalize(path)
+
+    @staticmethod
+    def __normalize(path: Path | str) -> str:
+        """
+        Pathオブジェクトの文字列表現と同じ表記にパスを正規化する。
+        ※os.path.normpath()は".."を親ディレクトリと畳み込むため、Pathオブジェクトで保持するベースパスと
+          表記が食い違ってしまう。そのため、重複した区切り文字と"."のみを除き、".."は残す。
+
         Args:
-            path (Path): 音楽ファイルのファイルパス。
+            path (Path | str): 正規化するファイルパス。
+
+        Returns:
+            str: 正規化したファイルパスの文字列。
         """
-        self.__path = path
+        path = os.fspath(path)
+        # 大半のパスは正規化済みのため、normpath()で変化しなければそのまま使う
+        # ※normpath()で変化しないパスは、".."の畳み込みも起きておらずPathオブジェクトとも同じ表記になる
+        if os.path.normpath(path) == path:
+            return path
+        if os.altsep:
+            path = path.replace(os.altsep, os.sep)
+        drive, root, tail = os.path.splitroot(path)
+        parts = [part for part in tail.split(os.sep) if part and part != '.']
+        return drive + root + os.sep.join(parts) or '.'
 
     def __str__(self) -> str:
         """文字列表現としてパスを返す。"""
-        return self.__path.__str__()
+        return self.__path
+
+    def __eq__(self, other: object) -> bool:
+        """保持するパスが等しい場合に等価とみなす。"""
+        if not isinstance(other, AudioPath):
+            return NotImplemented
+        return self.__path == other.__path
+
+    def __hash__(self) -> int:
+        """保持するパスに基づくハッシュ値を返す。"""
+        return hash(self.__path)
 
-    def __trim_relative_path_from_base_path(self, base_path_candidates: Tuple[Path, ...]) -> Path:
+    def __trim_relative_path_from_base_path(self, base_path_pattern: re.Pattern[str]) -> str:
         """
         指定されたベースパスを基準にして、音楽ファイルの相対パスを取得する。
 
         Args:
-            base_path_candidates (Tuple[Path, ...]): 基準となるベースディレクトリのパスの候補。
+            base_path_pattern (re.Pattern[str]): 基準となるベースディレクトリのパスの候補に前方一致する正規表現。
 
         Returns:
-            Path: ベースパスからの相対パス。
+            str: ベースパスからの相対パスの文字列。
 
         Raises:
             ValueError: 音楽ファイルのパスがベースパスに含まれていない場合。
         """
-        relative_path = None
-        for base_path_before in base_path_candidates:
-            try:
-                relative_path = self.__path.relative_to(base_path_before)
-            except ValueError:
-                pass
-            else:
-                break
-        else:  # すべてが親ディレクトリでなかった場合
+        # 照合した文字列そのものから切り出す（大文字・小文字の変換で文字数が変わる場合があるため）
+        match = base_path_pattern.match(self.__path)
+        if match is None:  # すべてが親ディレクトリでなかった場合
             raise ValueError(
                 f'M3Uファイル内の楽曲ファイルパス"{self.__path}"のフォルダが想定外です。'
             )
-        return relative_path
+        return self.__path[match.end() :]
 
-    def __pick_existing_path(self, existing_path_candidates: Tuple[Path, ...]) -> Path:
+    def __pick_existing_path(self, existing_path_candidates: Tuple[str, ...]) -> str:
         """
         指定された音楽ファイルのファイルパスリストから実在するパスを特定する。
 
         Args:
-            existing_path_candidates (Tuple[Path, ...]): 音楽ファイルパスの候補。
+            existing_path_candidates (Tuple[str, ...]): 音楽ファイルパスの候補の文字列。
 
         Returns:
-            Path: 実在するファイルのパス。
+            str: 実在するファイルのパスの文字列。
 
         Raises:
             FileNotFoundError: 実在するパスが見つからない場合。
             FileExistsError: 複数の実在するパスが見つかった場合。
         """
-        existing_paths = set()
+        existing_path = None
         for candidate_path in existing_path_candidates:
-            if candidate_path.exists():
-                existing_paths.add(candidate_path)
+            if not _path_exists(candidate_path):
+                continue
+            if existing_path is not None:  # 2つ目が見つかった時点で打ち切る
+                raise FileExistsError(
+                    f'M3Uファイル内の楽曲ファイルパス"{self.__path}"の現在の場所の候補が複数あります。: '
+                    + f'"{existing_path}", "{candidate_path}"'
+                )
+            existing_path = candidate_path
 
-        existing_paths_len = len(existing_paths)
-        if existing_paths_len == 0:
+        if existing_path is None:
             raise FileNotFoundError(
                 f'M3Uファイル内の楽曲ファイルパス"{self.__path}"の現在の場所を確認できません。'
             )
-        elif existing_paths_len > 1:
-            raise FileExistsError(
-                f'M3Uファイル内の楽曲ファイルパス"{self.__path}"の現在の場所の候補が複数あります。: '
-                + ', '.join(f'"{path}"' for path in existing_paths)
-            )
 
-        return existing_paths.pop()
+        return existing_path
 
     def search_existing_path(
         self,
-        base_paths_before_replace: Tuple[Path, ...],
-        base_paths_after_replace: Tuple[Path, ...],
+        base_path_pattern_before_replace: re.Pattern[str],
+        base_path_prefixes_after_replace: Tuple[str, ...],
     ) -> 'AudioPath':
         """
         指定された元のベースパス群に対する相対パスを使い、置換後の候補から実在するパスを検索する。
+        ベースパスは、M3uFile.replace_heads_of_audio_paths()で予め変換したものを受け取る。
 
         Args:
-            base_paths_before_replace (Tuple[Path, ...]): 元のベースディレクトリパスの候補。
-            base_paths_after_replace (Tuple[Path, ...]): 置換後のベースディレクトリパスの候補。
+            base_path_pattern_before_replace (re.Pattern[str]): 元のベースディレクトリパスの候補に
+                前方一致する正規表現。
+            base_path_prefixes_after_replace (Tuple[str, ...]): 置換後のベースディレクトリパスの候補。
+                末尾に区切り文字を付けた文字列。
 
         Returns:
             AudioPath: 実在する新しいパスを保持するAudioPathオブジェクト。
@@ -104,12 +193,13 @@ class AudioPath:
             FileNotFoundError: 実在する新パスが見つからない場合。
             FileExistsError: 実在する新パスの候補が複数存在する場合。
         """
-        if self.__path.exists():
+        if _path_exists(self.__path):
             return self
 
-        relative_path = self.__trim_relative_path_from_base_path(base_paths_before_replace)
+        relative_path = self.__trim_relative_path_from_base_path(base_path_pattern_before_replace)
         existing_path_candidates = tuple(
-            base_path / relative_path for base_path in base_paths_after_replace
+            base_path_prefix + relative_path
+            for base_path_prefix in base_path_prefixes_after_replace
         )
         existing_path = self.__pick_existing_path(existing_path_candidates)
         return AudioPath(existing_path)
@@ -120,8 +210,8 @@ class Diacritics:
     Unicodeの結合文字に関するユーティリティクラス。
     """
 
-    # Unicodeの全ての結合文字（正規結合クラスが0でない文字）を文字列としてつなげる
-    __ALL_COMBINING_CHARS = ''.join(
+    # Unicodeの全ての結合文字（正規結合クラスが0でない文字）の集合
+    __ALL_COMBINING_CHARS = frozenset(
         chr(cp) for cp in range(0x110000) if unicodedata.combining(chr(cp)) != 0
     )
 
@@ -137,19 +227,50 @@ class Diacritics:
         Returns:
             str: 合成済み文字列に変換された文字列。
         """
-        new_text_as_chars: List[str] = []
-        for char in text:
-
-            new_char = char
-            if char in cls.__ALL_COMBINING_CHARS and new_text_as_chars:
-                chars_to_compose = (
-                    new_text_as_chars.pop() + char
-                )  # 直前の基底文字と結合文字を並べる
-                new_char = unicodedata.normalize('NFC', chars_to_compose)  # 対応する合成文字を取得
-
-            new_text_as_chars.append(new_char)
+        # ASCIIのみ、または既にNFC正規化済みの文字列（大半のパス）は変換不要のためそのまま返す
+        # ※結合文字の範囲を列挙した正規表現での判定は、濁点・半濁点（U+3099, U+309A）などの
+        #   取りこぼしが起きやすいため使わず、Unicodeの定義に基づくis_normalized()で判定する。
+        if text.isascii() or unicodedata.is_normalized('NFC', text):
+            return text
+
+        # 結合文字の並びごとに、直前の基底文字と合わせてNFC正規化して、対応する合成済み文字に置き換える
+        # ※文字列全体をNFC正規化すると、CJK互換漢字（例: U+FA19）などの結合文字を伴わない文字まで
+        #   別の文字に置き換わり、実在するファイルパスと一致しなくなるため。
+        # 文字列に含まれる結合文字の位置を、文字の種類ごとにまとめて探す
+        # ※1文字ずつ判定するよりも、集合演算とstr.find()に任せた方が速いため
+        combining_char_positions = []
+        for combining_char in cls.__ALL_COMBINING_CHARS.intersection(text):
+            position = text.find(combining_char)
+            while position != -1:
+                combining_char_positions.append(position)
+                position = text.find(combining_char, position + 1)
+        combining_char_positions.sort()
+
+        new_text_parts: List[str] = []
+        copied_end = 0
+        i = 0
+        while i < len(combining_char_positions):
+            # 連続する結合文字の並びの範囲を求める
+            start = end = combining_char_positions[i]
+            i += 1
+            while i < len(combining_char_positions) and combining_char_positions[i] == end + 1:
+                end += 1
+                i += 1
+            end += 1
+
+            if start == 0:
+                # 文字列の先頭の結合文字は基底文字とみなし、後続の結合文字が無ければそのままにする
+                if end == 1:
+                    continue
+                base_start = 0
+            else:
+                base_start = start - 1
+            new_text_parts.append(text[copied_end:base_start])
+            new_text_parts.append(unicodedata.normalize('NFC', text[base_start:end]))
+            copied_end = end
+        new_text_parts.append(text[copied_end:])
 
-        return ''.join(new_text_as_chars)
+        return ''.join(new_text_parts)
 
 
 class M3uFile:
@@ -158,14 +279,18 @@ class M3uFile:
     インスタンス化はread_file()メソッドを通じて行う。
 
     Attributes:
-        __content (str): M3Uファイルの中身の文字列。
+        __lines (List[str]): M3Uファイルの各行の文字列（改行文字を含む）のリスト。
         __path_lines (List[str]): コメントアウトと空行を除く行の文字列のリスト。
-        __audio_paths (Tuple[AudioPath, ...]): 正規化した音楽ファイルのパスリスト。
+        __audio_paths (Tuple[AudioPath, ...]): 正規化した音楽ファイルのパスリスト。初回参照時に生成する。
+        __audio_paths_set (FrozenSet[AudioPath]): __audio_paths の要素の集合（含まれるかの判定用）。
+            初回参照時に生成する。
     """
 
-    __content: str
+    # str.splitlines()が行の区切りとみなす文字（行末から取り除いて行の本文を得る）
+    __LINE_BOUNDARY_CHARS = '\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+
+    __lines: List[str]
     __path_lines: List[str]
-    __audio_paths: Tuple[AudioPath, ...]
 
     def __new__(cls, *args, **kwargs):
         raise AttributeError('このクラスのコンストラクタは非公開です。')
@@ -174,31 +299,69 @@ class M3uFile:
         raise AttributeError('このクラスのコンストラクタは非公開です。')
 
     @classmethod
-    def __private_constructor(cls, content: str) -> Self:
+    def __private_constructor(cls, lines: List[str]) -> Self:
         """
         M3uFileのインスタンスを内部的に生成するためのプライベートコンストラクタ。
 
         Args:
-            content (str): M3Uファイルの中身の文字列。
+            lines (List[str]): M3Uファイルの各行の文字列（改行文字を含む）のリスト。
 
         Returns:
             M3uFile: 初期化されたM3uFileインスタンス。
         """
         self = super().__new__(cls)
 
-        self.__content = content
+        self.__lines = lines
 
-        lines = self.__content.splitlines()
-        self.__path_lines = [line for line in lines if line[:1] not in ('', '#')]
+        path_lines = []
+        for line_with_end in self.__lines:
+            line = line_with_end.rstrip(M3uFile.__LINE_BOUNDARY_CHARS)
+            if line[:1] in ('', '#'):
+                continue
+            path_lines.append(line)
+        self.__path_lines = path_lines
 
-        audio_paths_list = []
-        for path_line in self.__path_lines:
-            path_line_normalized = Diacritics.replace_combining_chars_to_precomposed(
-                path_line.strip()
-            )
-            audio_paths_list.append(AudioPath(Path(path_line_normalized)))
-        self.__audio_paths = tuple(audio_paths_list)
+        return self
 
+    @staticmethod
+    def __to_audio_path(path_line: str) -> AudioPath:
+        """
+        コメントアウトと空行を除く行の文字列を、正規化した音楽ファイルのパスに変換する。
+
+        Args:
+            path_line (str): コメントアウトと空行を除く行の文字列。
+
+        Returns:
+            AudioPath: 正規化した音楽ファイルのパス。
+        """
+        # ASCIIのみのパスなどは高速に判定されるため、パスの行ごとに正規化する
+        path_line_normalized = Diacritics.replace_combining_chars_to_precomposed(path_line.strip())
+        return AudioPath(path_line_normalized)
+
+    @cached_property
+    def __audio_paths(self) -> Tuple[AudioPath, ...]:
+        """正規化した音楽ファイルのパスリスト。初回参照時に生成する。"""
+        return tuple(M3uFile.__to_audio_path(path_line) for path_line in self.__path_lines)
+
+    @cached_property
+    def __audio_paths_set(self) -> FrozenSet[AudioPath]:
+        """__audio_paths の要素の集合。初回参照時に生成する。"""
+        return frozenset(self.__audio_paths)
+
+    @classmethod
+    def __from_replaced_lines(cls, lines: List[str]) -> Self:
+        """
+        置換後の各行から、書き出し用のM3uFileのインスタンスを内部的に生成するためのプライベートコンストラクタ。
+        write_file()に必要な各行の文字列のみを保持し、行の解析や音楽ファイルのパスの正規化は行わない。
+
+        Args:
+            lines (List[str]): 置換後のM3Uファイルの各行の文字列（改行文字を含む）のリスト。
+
+        Returns:
+            M3uFile: 初期化されたM3uFileインスタンス。
+        """
+        self = super().__new__(cls)
+        self.__lines = lines
         return self
 
     def __replace_audio_paths(self, paths_replace_dict: Dict[AudioPath, AudioPath]) -> 'M3uFile':
@@ -215,19 +378,10 @@ class M3uFile:
         Raises:
             ValueError: 置換対象のパスがM3Uファイル内に存在しない場合。
         """
-        replaced_content = self.__content
-        not_exist_audio_paths = set()
-        for original_audio_path, existing_audio_path in paths_replace_dict.items():
-            if original_audio_path not in self.__audio_paths:
-                not_exist_audio_paths.add(original_audio_path)
-                continue
-
-            # そのまま置換すると結合文字を含むパスが置換されないので、
-            # Diacritics.replace_combining_chars_to_precomposed()で変換前の文字列を取得
-            target_line_id = self.__audio_paths.index(original_audio_path)
-            target_path_line = self.__path_lines[target_line_id]
-
-            replaced_content = replaced_content.replace(target_path_line, str(existing_audio_path))
+        not_exist_audio_paths = []
+        for original_audio_path in paths_replace_dict:
+            if original_audio_path not in self.__audio_paths_set:
+                not_exist_audio_paths.append(original_audio_path)
 
         if len(not_exist_audio_paths) != 0:
             raise ValueError(
@@ -235,41 +389,90 @@ class M3uFile:
                 + ', '.join(f'"{str(path)}"' for path in not_exist_audio_paths)
             )
 
-        return M3uFile.__private_constructor(replaced_content)
+        # そのまま置換すると結合文字を含むパスが置換されないので、
+        # Diacritics.replace_combining_chars_to_precomposed()で変換する前の行をキーにする
+        path_lines_replace_dict: Dict[str, str] = {}
+        for path_line, audio_path in zip(self.__path_lines, self.__audio_paths):
+            if audio_path in paths_replace_dict:
+                path_lines_replace_dict[path_line] = str(paths_replace_dict[audio_path])
+
+        # 改行文字を保ったまま、1回の走査で各行を置換する
+        replaced_lines = []
+        for line_with_end in self.__lines:
+            line = line_with_end.rstrip(M3uFile.__LINE_BOUNDARY_CHARS)
+            replaced_line = path_lines_replace_dict.get(line)
+            if replaced_line is None:
+                replaced_lines.append(line_with_end)
+            else:
+                replaced_lines.append(replaced_line + line_with_end[len(line) :])
+
+        return M3uFile.__from_replaced_lines(replaced_lines)
 
     def replace_heads_of_audio_paths(
         self,
         base_paths_before_replace: Tuple[Path, ...],
         base_paths_after_replace: Tuple[Path, ...],
+        error_output: Optional[TextIO] = None,
     ) -> 'M3uFile':
         """
         M3Uファイル内の音楽ファイルパスのベースディレクトリ部分を置換し、新たなM3uFileインスタンスを生成する。
         置換後のベースディレクトリに基づく新しいファイルパスがサーバ上で1つ以上特定できない場合はエラーとなる。
-        特定できなかった音楽ファイルについては、標準エラー出力する。
+        特定できなかった音楽ファイルについては、標準エラー出力（またはerror_output）に出力する。
 
         Args:
             base_paths_before_replace (Tuple[Path, ...]): 元のベースディレクトリの候補。
             base_paths_after_replace (Tuple[Path, ...]): 置換後のベースディレクトリの候補。
+            error_output (Optional[TextIO]): 特定できなかった音楽ファイルの出力先。省略時は標準エラー出力。
 
         Returns:
-            M3uFile: パスが置換された新しいM3uFileインスタンス。
+            M3uFile: パスが置換された新しいM3uFileインスタンス。置換の必要が無い場合は自身。
 
         Raises:
             FileNotFoundError: 1つ以上のファイルのパスがサーバ上で特定できなかった場合。
             ValueError: 置換対象のパスがM3Uファイル内に存在しない場合。
         """
+        if error_output is None:
+            error_output = sys.stderr
+
+        # 全ての音楽ファイルのパスがM3Uファイル上の表記のまま実在する場合は、置換しても中身が変わらないため、
+        # 置換を行わずにそのまま返す
+        # ※正規化した音楽ファイルのパスリストは、置換時にもそのまま使い回す
+        if all(
+            str(audio_path) == path_line and _path_exists(path_line)
+            for path_line, audio_path in zip(self.__path_lines, self.__audio_paths)
+        ):
+            return self
+
         original_audio_path_tuple = self.__audio_paths
 
+        # 楽曲ごとにPathオブジェクトの比較や結合をせずに済むよう、ベースディレクトリを
+        # 末尾に区切り文字を付けた文字列にしておき、前方一致と文字列の連結で候補を作る
+        # ※元のベースディレクトリは、設定順に1回の照合で判定できるよう1つの正規表現にまとめる
+        #   Windowsでは、Path.relative_to()と同様に大文字・小文字を区別せずに照合する
+        # ※実在しない置換後のベースディレクトリは、楽曲ごとの候補から予め除外する
+        base_path_pattern_before_replace = re.compile(
+            '|'.join(
+                re.escape(os.path.join(base_path, '')) for base_path in base_paths_before_replace
+            )
+            or '(?!)',  # ベースディレクトリの指定が無い場合は、何にも一致させない
+            re.IGNORECASE if os.name == 'nt' else 0,
+        )
+        base_path_prefixes_after_replace = tuple(
+            os.path.join(base_path, '')
+            for base_path in base_paths_after_replace
+            if _path_exists(os.fspath(base_path))
+        )
+
         paths_replace_dict = {}
-        search_fail_paths = set()
+        search_fail_paths = []
         for original_audio_path in original_audio_path_tuple:
             try:
                 existing_audio_path = original_audio_path.search_existing_path(
-                    base_paths_before_replace, base_paths_after_replace
+                    base_path_pattern_before_replace, base_path_prefixes_after_replace
                 )
             except Exception as err:
-                search_fail_paths.add(original_audio_path)
-                print(f'{err.__class__.__name__}: {err}', file=sys.stderr)
+                search_fail_paths.append(original_audio_path)
+                print(f'{err.__class__.__name__}: {err}', file=error_output)
                 continue
 
             paths_replace_dict[original_audio_path] = existing_audio_path
@@ -296,7 +499,8 @@ class M3uFile:
         if path.exists():
             raise FileExistsError(f'既にファイルが存在するため上書きできません。: "{path}"')
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(self.__content, encoding='UTF-8')
+        with open(path, 'w', encoding='UTF-8') as fw:
+            fw.writelines(self.__lines)
 
     @classmethod
     def read_file(cls, path: Path) -> 'M3uFile':
@@ -309,8 +513,10 @@ class M3uFile:
         Returns:
             M3uFile: 初期化されたM3uFileインスタンス。
         """
-        content = path.read_text(encoding='UTF-8')
-        return cls.__private_constructor(content)
+        # readlines()は"\n"のみで区切るため、従来のread_text().splitlines()と同じ区切り方にそろえる
+        with open(path, 'r', encoding='UTF-8') as fr:
+            lines = fr.read().splitlines(keepends=True)
+        return cls.__private_constructor(lines)
 
 
 class Config(BaseModel):
@@ -370,9 +576,14 @@ class Config(BaseModel):
         Raises:
             TypeError: 設定ファイルで指定された値の型が文字列のリスト型ではない場合。
         """
-        if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+        if not isinstance(args, list):
             raise TypeError(f'設定ファイルに指定された値の型が想定外です。: "{args}"')
-        return tuple(Path(arg.strip()) for arg in args)
+        paths = []
+        for arg in args:  # 型の検証とPathオブジェクトへの変換を1回の走査で行う
+            if not isinstance(arg, str):
+                raise TypeError(f'設定ファイルに指定された値の型が想定外です。: "{args}"')
+            paths.append(Path(arg.strip()))
+        return tuple(paths)
 
     @field_validator('BASE_PATHS_AFTER_REPLACE', mode='before')
     @classmethod
@@ -391,10 +602,21 @@ class Config(BaseModel):
             TypeError: 設定ファイルで指定された値の型が文字列のリスト型ではない場合。
             FileNotFoundError: 設定ファイルで指定された値に対応するパスが1つでも存在しない場合。
         """
-        if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+        if not isinstance(args, list):
             raise TypeError(f'設定ファイルに指定された値の型が想定外です。: "{args}"')
-        path_tuple = tuple(Path(arg.strip()) for arg in args)
-        not_exist_paths = [path for path in path_tuple if not path.exists()]
+        paths = []
+        for arg in args:  # 型の検証とPathオブジェクトへの変換を1回の走査で行う
+            if not isinstance(arg, str):
+                raise TypeError(f'設定ファイルに指定された値の型が想定外です。: "{args}"')
+            paths.append(Path(arg.strip()))
+        path_tuple = tuple(paths)
+
+        # NASなどのパスは実在の確認に時間がかかることがあるため、並列に確認する
+        with ThreadPoolExecutor(max_workers=max(1, min(32, len(path_tuple)))) as executor:
+            path_exists_list = list(executor.map(Path.exists, path_tuple))
+        not_exist_paths = [
+            path for path, path_exists in zip(path_tuple, path_exists_list) if not path_exists
+        ]
         if len(not_exist_paths) != 0:
             raise FileNotFoundError(
                 '設定ファイルに記載されたいくつかのディレクトリパスがサーバ上に存在しません。: '
@@ -422,10 +644,77 @@ class Config(BaseModel):
         return cls(**content)
 
 
+def _process_m3u_file(
+    original_m3u_path: Path, config: Config, progress: str
+) -> List[Tuple[TextIO, str]]:
+    """
+    1つのM3Uファイルについて、読み込み・音楽ファイルのパスの置換・書き込みを行う。
+    並列に処理してもメッセージが混ざらないよう、メッセージはその場で出力せずに出力先と組にして返す。
+
+    Args:
+        original_m3u_path (Path): 入力するM3Uファイルのパス。
+        config (Config): 設定ファイルの設定値。
+        progress (str): メッセージに付与する進捗の表記。（例: "[1/178]"）
+
+    Returns:
+        List[Tuple[TextIO, str]]: 出力先（標準出力または標準エラー出力）とメッセージの組のリスト。
+    """
+    messages: List[Tuple[TextIO, str]] = [
+        (sys.stdout, f'---\n処理中 {progress} <- "{original_m3u_path}"')
+    ]
+
+    try:
+        original_m3u = M3uFile.read_file(original_m3u_path)
+    except Exception as err:
+        messages.append(
+            (
+                sys.stderr,
+                f'処理失敗(読み込み) {progress} '
+                + f'{err.__class__.__name__}: {err}: "{original_m3u_path}"',
+            )
+        )
+        return messages
+
+    search_errors = io.StringIO()
+    try:
+        replaced_m3u = original_m3u.replace_heads_of_audio_paths(
+            config.BASE_PATHS_BEFORE_REPLACE, config.BASE_PATHS_AFTER_REPLACE, search_errors
+        )
+    except Exception as err:
+        messages.extend((sys.stderr, line) for line in search_errors.getvalue().splitlines())
+        messages.append(
+            (
+                sys.stderr,
+                f'処理失敗(変換) {progress} '
+                + f'{err.__class__.__name__}: {err}: "{original_m3u_path}"',
+            )
+        )
+        return messages
+
+    relative_path = original_m3u_path.relative_to(config.DIR_PATH_FOR_INPUT_M3U_FILES)
+    replaced_m3u_path = config.DIR_PATH_FOR_OUTPUT_M3U_FILES / relative_path
+
+    try:
+        replaced_m3u.write_file(replaced_m3u_path)
+    except Exception as err:
+        messages.append(
+            (
+                sys.stderr,
+                f'処理失敗(書き込み) {progress} '
+                + f'{err.__class__.__name__}: {err}: "{replaced_m3u_path}"',
+            )
+        )
+        return messages
+
+    messages.append((sys.stdout, f'処理完了 {progress} -> "{replaced_m3u_path}"'))
+    return messages
+
+
 def replace_heads_of_audio_paths_in_m3u():
     """
     コマンドライン引数で指定された設定ファイルをもとに、M3Uファイル内の音楽ファイルの親ディレクトリのパスを一括置換する。
     1つのM3Uファイルの処理過程でExceptionが発生した場合は標準エラー出力し、次以降のM3Uファイルの処理を継続する。
+    M3Uファイルはスレッドで並列に処理するが、各M3Uファイルのメッセージはその順番どおりに出力する。
 
     Raises:
         ValueError: 設定ファイルの読み取りに失敗した場合や、引数の個数が不正な場合。
@@ -440,55 +729,25 @@ def replace_heads_of_audio_paths_in_m3u():
     except Exception as err:
         raise ValueError('設定ファイルの読み取りに失敗しました。') from err
 
-    original_m3u_paths_pattern1 = list(config.DIR_PATH_FOR_INPUT_M3U_FILES.rglob('*.m3u'))
-    original_m3u_paths_pattern2 = list(config.DIR_PATH_FOR_INPUT_M3U_FILES.rglob('*.m3u8'))
-    original_m3u_paths = original_m3u_paths_pattern1 + original_m3u_paths_pattern2
+    # 入力フォルダ配下を1回だけ走査し、拡張子が".m3u"または".m3u8"のファイルを集める
+    original_m3u_paths = []
+    for dir_path, _, file_names in os.walk(config.DIR_PATH_FOR_INPUT_M3U_FILES):
+        for file_name in file_names:
+            if os.path.normcase(file_name).endswith(('.m3u', '.m3u8')):
+                original_m3u_paths.append(Path(dir_path, file_name))
     original_m3u_paths_len = len(original_m3u_paths)
     if original_m3u_paths_len == 0:
         raise FileNotFoundError(
             f'設定ファイルに記載されたパス"{config.DIR_PATH_FOR_INPUT_M3U_FILES}"配下にはM3Uファイルが1件も存在しません。'
         )
 
-    for i, original_m3u_path in enumerate(original_m3u_paths):
-
-        print(f'---\n処理中 [{i + 1}/{original_m3u_paths_len}] <- "{original_m3u_path}"')
-
-        try:
-            original_m3u = M3uFile.read_file(original_m3u_path)
-        except Exception as err:
-            print(
-                f'処理失敗(読み込み) [{i + 1}/{original_m3u_paths_len}] '
-                + f'{err.__class__.__name__}: {err}: "{original_m3u_path}"',
-                file=sys.stderr,
-            )
-            continue
-
-        try:
-            replaced_m3u = original_m3u.replace_heads_of_audio_paths(
-                config.BASE_PATHS_BEFORE_REPLACE, config.BASE_PATHS_AFTER_REPLACE
-            )
-        except Exception as err:
-            print(
-                f'処理失敗(変換) [{i + 1}/{original_m3u_paths_len}] '
-                + f'{err.__class__.__name__}: {err}: "{original_m3u_path}"',
-                file=sys.stderr,
-            )
-            continue
-
-        relative_path = original_m3u_path.relative_to(config.DIR_PATH_FOR_INPUT_M3U_FILES)
-        replaced_m3u_path = config.DIR_PATH_FOR_OUTPUT_M3U_FILES / relative_path
-
-        try:
-            replaced_m3u.write_file(replaced_m3u_path)
-        except Exception as err:
-            print(
-                f'処理失敗(書き込み) [{i + 1}/{original_m3u_paths_len}] '
-                + f'{err.__class__.__name__}: {err}: "{replaced_m3u_path}"',
-                file=sys.stderr,
-            )
-            continue
-
-        print(f'処理完了 [{i + 1}/{original_m3u_paths_len}] -> "{replaced_m3u_path}"')
+    progresses = (f'[{i + 1}/{original_m3u_paths_len}]' for i in range(original_m3u_paths_len))
+    with ThreadPoolExecutor() as executor:
+        for messages in executor.map(
+            _process_m3u_file, original_m3u_paths, repeat(config), progresses
+        ):
+            for output, message in messages:
+                print(message, file=output)
 
 
 if __name__ == '__main__':